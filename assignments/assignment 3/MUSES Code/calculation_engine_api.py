@@ -1,13 +1,18 @@
 import requests
 import random
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 import os
 import sys
-import json
+import orjson
+import shutil
 import logging
-from time import sleep
+import threading
+from time import sleep, monotonic
+from concurrent.futures import ThreadPoolExecutor
 
-from io import StringIO
+from io import BytesIO
 import pandas as pd
 
 logging.basicConfig(stream=sys.stdout)
@@ -15,6 +20,73 @@ logger = logging.getLogger(__name__)
 logger.setLevel(os.getenv('LOG_LEVEL', logging.WARNING))
 
 
+class TokenBucket():
+    """Client-side token bucket used to pace requests before they are sent."""
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.timestamp = monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.timestamp) * self.rate)
+                self.timestamp = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            sleep(wait)
+
+
+class AimdController():
+    """Additive-increase / multiplicative-decrease concurrency limiter.
+
+    The in-flight request limit grows by one permit after a window of fast,
+    error-free responses and halves whenever the server throttles or errors,
+    so concurrent callers converge on the capacity the server will actually
+    sustain instead of relying on a static limit.
+    """
+
+    def __init__(self, max_concurrency=8, latency_target=1.0, window=20):
+        self.max_concurrency = max_concurrency
+        self.latency_target = latency_target
+        self.window = window
+        self.limit = 1
+        self.semaphore = threading.Semaphore(1)
+        self.lock = threading.Lock()
+        self.successes = 0
+        # Permits to absorb after a decrease, since a semaphore cannot shrink
+        self.debt = 0
+
+    def acquire(self):
+        self.semaphore.acquire()
+
+    def release(self, latency, throttled):
+        with self.lock:
+            if throttled:
+                new_limit = max(1, self.limit // 2)
+                self.debt += self.limit - new_limit
+                self.limit = new_limit
+                self.successes = 0
+            elif latency <= self.latency_target:
+                self.successes += 1
+                if self.successes >= self.window and self.limit < self.max_concurrency:
+                    self.limit += 1
+                    self.successes = 0
+                    self.semaphore.release()
+            else:
+                self.successes = 0
+            if self.debt > 0:
+                self.debt -= 1
+                return
+        self.semaphore.release()
+
+
 class CalculationEngineApi():
     def __init__(self, conf={}):
         # Import credentials and config from environment variables
@@ -27,12 +99,42 @@ class CalculationEngineApi():
             'api_url_basepath': os.environ.get('CE_API_URL_BASEPATH', 'api/v0'),
             # Max number of requests per second
             'api_rate_limit': int(os.environ.get('API_RATE_LIMIT_USER', '2')),
+            # Ceiling on the number of concurrent in-flight requests
+            'max_concurrency': int(os.environ.get('API_MAX_CONCURRENCY', '8')),
         }
         for param in self.conf:
             if param in conf:
                 self.conf[param] = conf[param]
         self.conf['url_base'] = f'''{self.conf['api_url_protocol']}://{self.conf['api_url_authority']}'''
         self.conf['api_url_base'] = f'''{self.conf['url_base']}/{self.conf['api_url_basepath']}'''
+        # Precompute the endpoint bases once instead of rebuilding them
+        # from the conf dict on every call
+        api_url_base = self.conf['api_url_base']
+        self._ep_token = f'''{api_url_base}/token/'''
+        self._ep_job = f'''{api_url_base}/ce/job/'''
+        self._ep_upload = f'''{api_url_base}/ce/upload/'''
+        self._ep_metrics = f'''{api_url_base}/ce/metrics/'''
+        self._ep_module = f'''{api_url_base}/ce/module/'''
+        self._ep_user = f'''{api_url_base}/user/'''
+        self._ep_download = f'''{self.conf['url_base']}/ce/download/'''
+        # Reuse a single session with a connection pool so that repeated API calls
+        # share keep-alive connections instead of opening a new one per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Pace requests client-side so bursts stay under the server rate limit
+        self._bucket = TokenBucket(
+            rate=self.conf['api_rate_limit'],
+            capacity=self.conf['api_rate_limit'],
+        )
+        # Adapt the number of concurrent requests to the server's capacity
+        self._aimd = AimdController(max_concurrency=self.conf['max_concurrency'])
+        # Per-instance cache of upload metadata keyed by uuid, cleared
+        # whenever an upload is modified or deleted; entries also expire
+        # after a short TTL so changes made outside this client are seen
+        self._upload_meta_cache = {}
+        self._upload_meta_ttl = 60.0
         if self.conf['token']:
             self.api_token = self.conf['token']
         else:
@@ -40,12 +142,31 @@ class CalculationEngineApi():
         self.auth_header = {
             'Authorization': f'''Token {self.api_token}''',
         }
+        # Authenticate every request made through the session; JSON endpoints
+        # still pass json_headers explicitly, and multipart uploads let
+        # requests set its own Content-Type
+        self.session.headers.update(self.auth_header)
+        # Advertise every compression codec urllib3 can actually decode;
+        # its ACCEPT_ENCODING adds br/zstd only when urllib3[brotli] /
+        # zstandard are installed, so the server never picks an encoding
+        # this client would hand back as undecoded bytes
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
         self.json_headers = self.auth_header
         self.json_headers['Content-Type'] = 'application/json'
 
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def get_api_token(self):
-        url = f'''{self.conf['api_url_base']}/token/'''
-        response = requests.post(
+        url = self._ep_token
+        response = self._request(
+            'post',
             url,
             headers={
                 'Content-Type': 'application/json',
@@ -64,171 +185,220 @@ class CalculationEngineApi():
         except Exception as err:
             logger.error(f'''Invalid response object: {err}''')
             return response
-        logger.debug(f'''Response code: {response.status_code}''')
+        logger.debug('Response code: %s', response.status_code)
         try:
             assert response.status_code in range(200, 300)
             if parse_json:
-                data = response.json()
-                logger.debug(json.dumps(data, indent=2))
+                # orjson skips the charset sniffing that response.json() does
+                data = orjson.loads(response.content)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
                 return data
             else:
                 return response
         except Exception:
-            try:
-                logger.debug(f'''ERROR: {json.dumps(response.text, indent=2)}''')
-            except Exception:
-                logger.debug(f'''ERROR: {response.text}''')
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    logger.debug('ERROR: %s', orjson.dumps(response.text, option=orjson.OPT_INDENT_2).decode())
+                except Exception:
+                    logger.debug('ERROR: %s', response.text)
             return response
 
     def login(self):
-        response = requests.post(
+        response = self._request(
+            'post',
             f'''{self.conf['url_base']}/admin/login/''',
             auth=HTTPBasicAuth(self.conf['username'], self.conf['password']),
         )
         data = self.display_response(response)
         return data
 
-    def rate_limiter(self, response):
-        rate_limit_status_code = 429
-        if response.status_code == rate_limit_status_code:
-            logger.debug(f'Response code {rate_limit_status_code} received. Rate limiter engaged.')
-            sleep(1.0 / self.conf['api_rate_limit'])
-        return response.status_code == rate_limit_status_code
+    @staticmethod
+    def _rewind_files(kwargs):
+        # Rewind any file objects so a retried request re-sends the full body
+        for value in kwargs.get('files', {}).values():
+            fp = value[1] if isinstance(value, tuple) else value
+            if hasattr(fp, 'seek'):
+                fp.seek(0)
+
+    def _request(self, method, url, **kwargs):
+        """Send a rate-limited request, backing off when the server says 429.
+
+        The token bucket paces requests before they are sent, so bursts
+        rarely hit the server limit at all. If a 429 still comes back, the
+        retry honors the Retry-After header when present and otherwise uses
+        exponential backoff, with a little jitter either way. An AIMD
+        controller additionally bounds how many requests are in flight at
+        once, widening on sustained success and halving on throttling.
+        """
+        self._aimd.acquire()
+        throttled = False
+        start = monotonic()
+        try:
+            self._bucket.acquire()
+            response = self.session.request(method, url, **kwargs)
+            attempt = 0
+            while response.status_code == 429:
+                throttled = True
+                delay = float(response.headers.get('Retry-After', 2 ** attempt))
+                logger.debug('Response code 429 received. Backing off for %s seconds.', delay)
+                sleep(delay + random.uniform(0, 0.25))
+                attempt += 1
+                self._rewind_files(kwargs)
+                self._bucket.acquire()
+                response = self.session.request(method, url, **kwargs)
+            if response.status_code >= 500:
+                throttled = True
+            return response
+        finally:
+            self._aimd.release(monotonic() - start, throttled)
+
+    def _get_page(self, url):
+        return self._request(
+            'get',
+            url,
+            headers=self.json_headers,
+        )
+
+    def _paginate(self, url):
+        """Yield each page of a paginated listing endpoint.
+
+        The GET for page k+1 is issued on a background thread as soon as
+        page k's 'next' URL is known, so its network latency overlaps with
+        the caller's processing of page k. If a page request fails, the raw
+        response object is yielded instead of parsed data.
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            response = self._get_page(url)
+            while True:
+                if response.status_code not in range(200, 300):
+                    yield response
+                    return
+                response_data = orjson.loads(response.content)
+                url = response_data['next']
+                # If the URL to the next page of results was included in the response, prefetch it
+                logger.debug('Next page of results: "%s"', url)
+                future = pool.submit(self._get_page, url) if url else None
+                yield response_data
+                if future is None:
+                    return
+                response = future.result()
 
     def job_create(self, name='', description="", config={}):
         if not name:
             name = f'''test-{random.randrange(10000, 99999)}'''
-        while True:
-            response = requests.post(
-                f'''{self.conf['api_url_base']}/ce/job/''',
-                json={
-                    'name': name,
-                    'config': config,
-                    'description': description,
-                },
-                headers=self.json_headers,
-            )
-            if not self.rate_limiter(response):
-                break
+        response = self._request(
+            'post',
+            self._ep_job,
+            json={
+                'name': name,
+                'config': config,
+                'description': description,
+            },
+            headers=self.json_headers,
+        )
         return self.display_response(response)
 
     def job_delete(self, uuid=None):
-        while True:
-            response = requests.delete(
-                f'''{self.conf['api_url_base']}/ce/job/{uuid}/''',
-                headers=self.json_headers,
-            )
-            if not self.rate_limiter(response):
-                break
+        response = self._request(
+            'delete',
+            f'''{self._ep_job}{uuid}/''',
+            headers=self.json_headers,
+        )
+        return self.display_response(response, parse_json=False)
+
+    def bulk_job_delete(self, uuids):
+        response = self._request(
+            'post',
+            f'''{self._ep_job}bulk_delete/''',
+            json={'uuids': list(uuids)},
+            headers=self.json_headers,
+        )
         return self.display_response(response, parse_json=False)
 
     def job_delete_all(self):
         all_jobs = self.job_list()
-        for job in all_jobs:
-            logger.debug(job)
-            while True:
-                response = requests.delete(
-                    f'''{self.conf['api_url_base']}/ce/job/{job['uuid']}/''',
-                    headers=self.json_headers,
-                )
-                if not self.rate_limiter(response):
-                    break
-            self.display_response(response, parse_json=False)
+        if not all_jobs:
+            return
+        uuids = [job['uuid'] for job in all_jobs]
+        max_workers = min(8, self.conf['api_rate_limit'] * 4)
+        # Collapse the per-job DELETEs into chunked bulk requests
+        chunks = [uuids[i:i + 50] for i in range(0, len(uuids), 50)]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            responses = list(pool.map(self.bulk_job_delete, chunks))
+        if any(getattr(response, 'status_code', 0) == 404 for response in responses):
+            # Server without the bulk endpoint; fall back to concurrent
+            # single deletes shaped by the token bucket
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                list(pool.map(self.job_delete, uuids))
 
     def job_list(self, uuid=''):
         jobs = []
-        url = f'''{self.conf['api_url_base']}/ce/job/'''
-        if uuid:
-            url = f'''{url}{uuid}/'''
-        while True:
-            response = requests.get(
-                url,
-                headers=self.json_headers,
-            )
-            if not self.rate_limiter(response):
-                break
-        if response.status_code not in range(200, 300):
-            return response
-        response_data = response.json()
+        url = self._ep_job
         # If a single job is being requested, return the data
         if uuid:
-            return response_data
-        # If all job info is being requested, append the result list and then fetch the next page of results
-        jobs = response_data['results']
-        url = response_data['next']
-        # If the URL to the next page of results was included in the response, fetch it
-        logger.debug(f'''Next page of results: "{url}"''')
-        while url:
-            while True:
-                response = requests.get(
-                    url,
-                    headers=self.json_headers,
-                )
-                if not self.rate_limiter(response):
-                    break
-            response_data = response.json()
-            jobs += response_data['results']
-            url = response_data['next']
+            response = self._get_page(f'''{url}{uuid}/''')
+            if response.status_code not in range(200, 300):
+                return response
+            return orjson.loads(response.content)
+        # If all job info is being requested, walk the pages while the next one is prefetched
+        for page in self._paginate(url):
+            if isinstance(page, requests.Response):
+                return page
+            jobs += page['results']
         return jobs
 
     def upload_list(self, uuid=''):
         uploads = []
-        url = f'''{self.conf['api_url_base']}/ce/upload/'''
-        if uuid:
-            url = f'''{url}{uuid}/'''
-        while True:
-            response = requests.get(
-                url,
-                headers=self.json_headers,
-            )
-            if not self.rate_limiter(response):
-                break
-        if response.status_code not in range(200, 300):
-            return response
-        response_data = response.json()
+        url = self._ep_upload
         # If a single upload is being requested, return the data
         if uuid:
-            return response_data
-        # If all upload info is being requested, append the result list and then fetch the next page of results
-        uploads = response_data['results']
-        url = response_data['next']
-        # If the URL to the next page of results was included in the response, fetch it
-        logger.debug(f'''Next page of results: "{url}"''')
-        while url:
-            while True:
-                response = requests.get(
-                    url,
-                    headers=self.json_headers,
-                )
-                if not self.rate_limiter(response):
-                    break
-            response_data = response.json()
-            uploads += response_data['results']
-            url = response_data['next']
+            response = self._get_page(f'''{url}{uuid}/''')
+            if response.status_code not in range(200, 300):
+                return response
+            return orjson.loads(response.content)
+        # If all upload info is being requested, walk the pages while the next one is prefetched
+        for page in self._paginate(url):
+            if isinstance(page, requests.Response):
+                return page
+            uploads += page['results']
         return uploads
 
+    def _upload_meta(self, uuid):
+        cached = self._upload_meta_cache.get(uuid)
+        if cached and monotonic() - cached[1] < self._upload_meta_ttl:
+            return cached[0]
+        upload = self.upload_list(uuid=uuid)
+        # Only cache successful lookups; an error Response here is
+        # transient and must be retried on the next call
+        if isinstance(upload, dict):
+            if len(self._upload_meta_cache) >= 256:
+                self._upload_meta_cache.clear()
+            self._upload_meta_cache[uuid] = (upload, monotonic())
+        else:
+            self._upload_meta_cache.pop(uuid, None)
+        return upload
+
     def upload_file(self, file_path='', upload_path='', description='', public=False):
-        url = f'''{self.conf['api_url_base']}/ce/upload/'''
-        while True:
-            with open(file_path, 'rb') as fp:
-                response = requests.put(
-                    url,
-                    headers={
-                        'Authorization': f'''Token {self.api_token}''',
-                    },
-                    files={'file': fp},
-                    data={
-                        'path': upload_path,
-                        'description': description,
-                        'public': public,
-                    },
-                )
-            if not self.rate_limiter(response):
-                break
+        url = self._ep_upload
+        with open(file_path, 'rb') as fp:
+            response = self._request(
+                'put',
+                url,
+                headers={
+                    'Authorization': f'''Token {self.api_token}''',
+                },
+                files={'file': fp},
+                data={
+                    'path': upload_path,
+                    'description': description,
+                    'public': public,
+                },
+            )
         return self.display_response(response)
 
     def upload_file_update(self, uuid, public=None, description=None, parse_json=True):
-        url = f'''{self.conf['api_url_base']}/ce/upload/{uuid}/'''
+        url = f'''{self._ep_upload}{uuid}/'''
         data = {}
         if public is not None:
             assert isinstance(public, bool)
@@ -236,62 +406,56 @@ class CalculationEngineApi():
         if description is not None:
             assert isinstance(description, str)
             data['description'] = description
-        while True:
-            response = requests.patch(
-                url,
-                headers={
-                    'Authorization': f'''Token {self.api_token}''',
-                },
-                data=data,
-            )
-            if not self.rate_limiter(response):
-                break
+        response = self._request(
+            'patch',
+            url,
+            headers={
+                'Authorization': f'''Token {self.api_token}''',
+            },
+            data=data,
+        )
+        self._upload_meta_cache.clear()
         return self.display_response(response, parse_json=parse_json)
 
     def download_job_file(self, uuid, path, root_dir='/tmp/ce/jobs'):
-        url = f'''{self.conf['url_base']}/ce/download/{uuid}/{path.strip('/')}'''
+        url = f'''{self._ep_download}{uuid}/{path.strip('/')}'''
         file_path = os.path.join(root_dir, uuid, path.strip('/'))
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with requests.get(url, headers=self.json_headers, stream=True) as response:
-            if self.rate_limiter(response):
-                return self.download_job_file(uuid, path, root_dir)
+        with self._request('get', url, headers=self.json_headers, stream=True) as response:
             response.raise_for_status()
+            # Copy the decoded stream in 1 MiB chunks instead of looping
+            # over 8 KiB chunks in Python
+            response.raw.decode_content = True
             with open(file_path, 'wb') as fp:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        fp.write(chunk)
+                shutil.copyfileobj(response.raw, fp, length=1024 * 1024)
 
     def download_uploaded_file(self, uuid, root_dir='/tmp/ce/uploads'):
-        url = f'''{self.conf['url_base']}/ce/download/{uuid}'''
-        upload = self.upload_list(uuid=uuid)
+        url = f'''{self._ep_download}{uuid}'''
+        upload = self._upload_meta(uuid)
         if 'path' not in upload:
             logger.error('Upload not found.')
             return
         path = upload['path'].strip('/')
         file_path = os.path.join(root_dir, uuid, path)
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with requests.get(url, headers=self.json_headers, stream=True) as response:
-            if self.rate_limiter(response):
-                return self.download_uploaded_file(uuid, root_dir)
+        with self._request('get', url, headers=self.json_headers, stream=True) as response:
             response.raise_for_status()
+            response.raw.decode_content = True
             with open(file_path, 'wb') as fp:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        fp.write(chunk)
+                shutil.copyfileobj(response.raw, fp, length=1024 * 1024)
 
     def delete_uploaded_file(self, uuid, parse_json=False):
-        url = f'''{self.conf['api_url_base']}/ce/upload/{uuid}/'''
-        while True:
-            response = requests.delete(
-                url,
-                headers=self.json_headers,
-            )
-            if not self.rate_limiter(response):
-                break
+        url = f'''{self._ep_upload}{uuid}/'''
+        response = self._request(
+            'delete',
+            url,
+            headers=self.json_headers,
+        )
+        self._upload_meta_cache.clear()
         return self.display_response(response, parse_json=parse_json)
 
     def update_job(self, job_id, saved=None, public=None):
-        url = f'''{self.conf['api_url_base']}/ce/job/{job_id}/'''
+        url = f'''{self._ep_job}{job_id}/'''
         data = {}
         if saved is not None:
             assert isinstance(saved, bool)
@@ -299,122 +463,100 @@ class CalculationEngineApi():
         if public is not None:
             assert isinstance(public, bool)
             data['public'] = public
-        while True:
-            response = requests.patch(
-                url,
-                headers=self.json_headers,
-                json=data,
-            )
-            if not self.rate_limiter(response):
-                break
+        response = self._request(
+            'patch',
+            url,
+            headers=self.json_headers,
+            json=data,
+        )
         return self.display_response(response)
 
     def list_modules(self):
-        url = f'''{self.conf['api_url_base']}/ce/module/'''
-        while True:
-            response = requests.get(
-                url,
-                headers=self.json_headers,
-            )
-            if not self.rate_limiter(response):
-                break
+        url = self._ep_module
+        response = self._request(
+            'get',
+            url,
+            headers=self.json_headers,
+        )
         return self.display_response(response)
 
     def list_users(self):
-        url = f'''{self.conf['api_url_base']}/user/'''
-        while True:
-            response = requests.get(
-                url,
-                headers=self.json_headers,
-            )
-            if not self.rate_limiter(response):
-                break
+        url = self._ep_user
+        response = self._request(
+            'get',
+            url,
+            headers=self.json_headers,
+        )
         return self.display_response(response)
 
     def delete_user(self, username):
-        url = f'''{self.conf['api_url_base']}/user/{username}/'''
-        while True:
-            response = requests.delete(
-                url,
-                headers=self.json_headers,
-            )
-            if not self.rate_limiter(response):
-                break
+        url = f'''{self._ep_user}{username}/'''
+        response = self._request(
+            'delete',
+            url,
+            headers=self.json_headers,
+        )
         return self.display_response(response)
 
     def create_user(self, username, password, first_name='', last_name='', is_staff=True):
-        url = f'''{self.conf['api_url_base']}/user/'''
-        while True:
-            response = requests.post(
-                url,
-                headers=self.json_headers,
-                json={
-                    'username': username,
-                    'email': f'{username}@example.com',
-                    'is_staff': is_staff,
-                    'first_name': first_name if first_name else username,
-                    'last_name': last_name if last_name else username,
-                    'password': password,
-                },
-            )
-            if not self.rate_limiter(response):
-                break
+        url = self._ep_user
+        response = self._request(
+            'post',
+            url,
+            headers=self.json_headers,
+            json={
+                'username': username,
+                'email': f'{username}@example.com',
+                'is_staff': is_staff,
+                'first_name': first_name if first_name else username,
+                'last_name': last_name if last_name else username,
+                'password': password,
+            },
+        )
         return self.display_response(response)
 
     def get_metrics(self):
         metrics = []
-        url = f'''{self.conf['api_url_base']}/ce/metrics/'''
-        while url:
-            while True:
-                response = requests.get(
-                    url,
-                    headers=self.json_headers,
-                )
-                if not self.rate_limiter(response):
-                    break
-            metrics_data = response.json()
-            metrics.extend(metrics_data['results'])
-            url = metrics_data['next']
+        url = self._ep_metrics
+        for page in self._paginate(url):
+            if isinstance(page, requests.Response):
+                return page
+            metrics.extend(page['results'])
         return metrics
 
 
-    def read_job_file_to_dataframe(self, uuid, path,**kwargs):
-        url = f'''{self.conf['url_base']}/ce/download/{uuid}/{path.strip('/')}'''
-
-
-        try: 
-            response = requests.get(url, headers=self.json_headers)
-
-            response.raise_for_status()
-
-            # Convert the content of the response to a DataFrame
-            file_content = StringIO(response.text)
-            df = pd.read_csv(file_content, **kwargs)
-
-            return df
-        
+    def read_job_file_to_dataframe(self, uuid, path, **kwargs):
+        url = f'''{self._ep_download}{uuid}/{path.strip('/')}'''
+        try:
+            with self._request('get', url, headers=self.json_headers, stream=True) as response:
+                response.raise_for_status()
+                # Feed the decoded byte stream straight into the CSV parser,
+                # avoiding an intermediate copy of the file as a Python string
+                response.raw.decode_content = True
+                return pd.read_csv(response.raw, **kwargs)
         except Exception as e:
             logger.error(f"Error reading file: {e}")
             return None
-            
+
     def upload_dataframe(self, df, upload_path, description='', public=False):
-        url = f"{self.conf['api_url_base']}/ce/upload/"
-        while True:
-            with StringIO() as fp:
-                df.to_csv(fp, index=False)
-                # Move file pointer back to start
-                fp.seek(0)
-                
-                response = requests.put(
-                    url,
-                    headers={'Authorization': f"Token {self.api_token}"},
-                    files={'file': fp},
-                    data={
-                        'path': upload_path,
-                        'description': description,
-                        'public': public,
-                    },
-                )
-            if not self.rate_limiter(response):
-                break
+        url = self._ep_upload
+        # Write the CSV as UTF-8 bytes once; a bytes buffer is sent as-is,
+        # whereas a StringIO body would be re-encoded by requests on send
+        with BytesIO() as fp:
+            df.to_csv(fp, index=False)
+            # Move file pointer back to start
+            fp.seek(0)
+
+            file_name = os.path.basename(upload_path) or 'data.csv'
+            response = self._request(
+                'put',
+                url,
+                headers={'Authorization': f"Token {self.api_token}"},
+                files={'file': (file_name, fp, 'text/csv')},
+                data={
+                    'path': upload_path,
+                    'description': description,
+                    'public': public,
+                },
+            )
         return self.display_response(response)
\ No newline at end of file
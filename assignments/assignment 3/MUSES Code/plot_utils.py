@@ -12,6 +12,7 @@ Author: Nikolas Cruz Camacho
 Email:  cnc6@illinois.edu
 """
 
+import numpy as np
 import plotly.graph_objects as go
 
 # Mapping from raw column names to display labels
@@ -32,6 +33,10 @@ label_map = {
     'Decuplet_nB': 'Decuplet Baryon Density [fm^-3]',
 }
 
+# Cap on the number of markers sent to the browser in a 3D scatter; denser
+# tables are thinned by a stride before plotting
+MAX_SCATTER3D_POINTS = 20000
+
 qlimr_label_map = {
     'e_c': 'central energy density [MeV/fm^3]',
     'Q': 'cuadrupole moment',
@@ -67,20 +72,24 @@ def plot_QLIMR_observables(df, x_col, y_col, order='e_c', logy=False, logx=False
     """
     print(f"Plotting 1D QLIMR observables for columns: {x_col} vs {y_col}")
 
-    if x_col not in df.columns:
-        raise ValueError(f"Column '{x_col}' not found in DataFrame.")
-    if y_col not in df.columns:
-        raise ValueError(f"Column '{y_col}' not found in DataFrame.")
+    cols = set(df.columns)
+    missing = [col for col in (x_col, y_col, order) if col not in cols]
+    if missing:
+        raise ValueError(f"Columns not found in DataFrame: {missing}")
 
-    df = df.sort_values(by=order)
+    # Sort just the plotted columns with argsort instead of copying the
+    # whole DataFrame with sort_values
+    order_idx = np.argsort(df[order].to_numpy())
+    xs = df[x_col].to_numpy()[order_idx]
+    ys = df[y_col].to_numpy()[order_idx]
 
     x_label = qlimr_label_map.get(x_col, x_col)
     y_label = qlimr_label_map.get(y_col, y_col)
 
     fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=df[x_col],
-        y=df[y_col],
+        x=xs,
+        y=ys,
         mode='lines',
         name=f'{y_col} vs {x_col}'
     ))
@@ -120,20 +129,25 @@ def plot_1D_CMF_EoS(df, x_col, y_col):
     """
     print(f"Plotting 1D CMF EOS for columns: {x_col} vs {y_col}")
 
-    if x_col not in df.columns:
-        raise ValueError(f"Column '{x_col}' not found in DataFrame.")
-    if y_col not in df.columns:
-        raise ValueError(f"Column '{y_col}' not found in DataFrame.")
+    cols = set(df.columns)
+    missing = [col for col in (x_col, y_col) if col not in cols]
+    if missing:
+        raise ValueError(f"Columns not found in DataFrame: {missing}")
 
-    df = df.sort_values(by=x_col)
+    # Sort just the plotted columns with argsort instead of copying the
+    # whole DataFrame with sort_values
+    xs = df[x_col].to_numpy()
+    order_idx = np.argsort(xs)
+    xs = xs[order_idx]
+    ys = df[y_col].to_numpy()[order_idx]
 
     x_label = label_map.get(x_col, x_col)
     y_label = label_map.get(y_col, y_col)
 
     fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=df[x_col],
-        y=df[y_col],
+        x=xs,
+        y=ys,
         mode='lines',
         name='CMF EOS'
     ))
@@ -170,22 +184,28 @@ def plot_2D_CMF_EoS(df, x_col, y_col, z_col):
     """
     print(f"Plotting 2D CMF EOS for columns: {x_col} vs {y_col} vs {z_col}")
 
-    for col in (x_col, y_col, z_col):
-        if col not in df.columns:
-            raise ValueError(f"Column '{col}' not found in DataFrame.")
+    cols = set(df.columns)
+    missing = [col for col in (x_col, y_col, z_col) if col not in cols]
+    if missing:
+        raise ValueError(f"Columns not found in DataFrame: {missing}")
 
     x_label = label_map.get(x_col, x_col)
     y_label = label_map.get(y_col, y_col)
     z_label = label_map.get(z_col, z_col)
 
+    stride = max(1, len(df) // MAX_SCATTER3D_POINTS)
+    x = df[x_col].to_numpy()[::stride]
+    y = df[y_col].to_numpy()[::stride]
+    z = df[z_col].to_numpy()[::stride]
+
     fig = go.Figure(data=[go.Scatter3d(
-        x=df[x_col],
-        y=df[y_col],
-        z=df[z_col],
+        x=x,
+        y=y,
+        z=z,
         mode='markers',
         marker=dict(
             size=3,
-            color=df[z_col],
+            color=z,
             colorscale='Viridis',
             colorbar=dict(title=z_label),
             opacity=0.8
@@ -227,25 +247,33 @@ def plot_2D_CMF_EoS_with_Lepton(cmf_df, lepton_df, y_col):
     x_col = 'E'  # Energy Density
     z_col = 'P'  # Pressure
 
-    for col in (x_col, y_col, z_col):
-        if col not in cmf_df.columns:
-            raise ValueError(f"Column '{col}' not found in CMF DataFrame.")
-        if col not in lepton_df.columns:
-            raise ValueError(f"Column '{col}' not found in Lepton DataFrame.")
+    cmf_cols = set(cmf_df.columns)
+    missing = [col for col in (x_col, y_col, z_col) if col not in cmf_cols]
+    if missing:
+        raise ValueError(f"Columns not found in CMF DataFrame: {missing}")
+    lepton_cols = set(lepton_df.columns)
+    missing = [col for col in (x_col, y_col, z_col) if col not in lepton_cols]
+    if missing:
+        raise ValueError(f"Columns not found in Lepton DataFrame: {missing}")
 
     x_label = label_map.get(x_col, x_col)
     y_label = label_map.get(y_col, y_col)
     z_label = label_map.get(z_col, z_col)
 
+    stride = max(1, len(cmf_df) // MAX_SCATTER3D_POINTS)
+    x = cmf_df[x_col].to_numpy()[::stride]
+    y = cmf_df[y_col].to_numpy()[::stride]
+    z = cmf_df[z_col].to_numpy()[::stride]
+
     scatter_trace = go.Scatter3d(
-        x=cmf_df[x_col],
-        y=cmf_df[y_col],
-        z=cmf_df[z_col],
+        x=x,
+        y=y,
+        z=z,
         mode='markers',
         name='CMF EOS',
         marker=dict(
             size=3,
-            color=cmf_df[z_col],
+            color=z,
             colorscale='Viridis',
             colorbar=dict(title=z_label),
             opacity=0.8
@@ -253,9 +281,9 @@ def plot_2D_CMF_EoS_with_Lepton(cmf_df, lepton_df, y_col):
     )
 
     line_trace = go.Scatter3d(
-        x=lepton_df[x_col],
-        y=lepton_df[y_col],
-        z=lepton_df[z_col],
+        x=lepton_df[x_col].to_numpy(),
+        y=lepton_df[y_col].to_numpy(),
+        z=lepton_df[z_col].to_numpy(),
         mode='lines',
         name='Lepton EOS',
         line=dict(color='red', width=6)
@@ -12,7 +12,9 @@ Email:  cnc6@illinois.edu
 import sys
 import os
 import time
+import random
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging to output to stdout, with level determined by the LOG_LEVEL environment variable.
 logging.basicConfig(stream=sys.stdout)
@@ -32,7 +34,9 @@ def monitor_job(job_id, api, time_limit=3600, sleep_interval=60):
     time_limit : int, optional
         Maximum number of seconds to wait before giving up (default: 3600 seconds).
     sleep_interval : int, optional
-        Number of seconds to wait between status checks (default: 60 seconds).
+        Maximum number of seconds to wait between status checks (default: 60 seconds).
+        Polling starts at 2 seconds and doubles after each check up to this cap,
+        so short jobs are detected quickly while long jobs are polled sparingly.
 
     Returns:
     --------
@@ -41,6 +45,7 @@ def monitor_job(job_id, api, time_limit=3600, sleep_interval=60):
     """
     try:
         start_time = time.time()
+        delay = 2.0
 
         while True:
             job_status = api.job_list(uuid=job_id)
@@ -49,14 +54,16 @@ def monitor_job(job_id, api, time_limit=3600, sleep_interval=60):
             if job_status['status'] in ['SUCCESS', 'FAILURE']:
                 logging.info(f'Job completed. \nStatus: {job_status["status"]}')
                 break
-            
+
             else:
                 if elapsed_time > time_limit:
                     logging.error(f"Job {job_id} exceeded the time limit of {time_limit} seconds.")
                     break
                 else:
-                    time.sleep(sleep_interval)
-            
+                    # Exponential backoff with jitter, capped at sleep_interval
+                    time.sleep(delay + random.uniform(0, 0.5))
+                    delay = min(sleep_interval, delay * 2)
+
         return job_status
     except Exception as e:
         logging.error(f'An error occurred during job monitoring for job {job_id}: {e}')
@@ -88,11 +95,17 @@ def download_successful_job(job_id, job_status, api, output_dir='./downloads/'):
         
         print(f'Downloading files into {os.path.join(output_dir, job_id)}')
 
-        # Iterate through all files associated with the job and download each
+        # Download all non-empty files associated with the job concurrently
+        files_to_download = []
         for file_info in job_status['files']:
             print(f'  "{file_info["path"]}"...')
             if file_info['size'] > 0:
-                api.download_job_file(job_id, file_info['path'], root_dir=output_dir)
+                files_to_download.append(file_info)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(
+                lambda file_info: api.download_job_file(job_id, file_info['path'], root_dir=output_dir),
+                files_to_download,
+            ))
 
     elif job_status['status'] == 'FAILURE':
         print(f'Job failed. Error: "{job_status["error_info"]}"')